@@ -5,7 +5,7 @@ import os
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class AlpacaSettings:
     """Settings for the Alpaca client."""
 
@@ -14,14 +14,14 @@ class AlpacaSettings:
     base_url: str = "https://paper-api.alpaca.markets"
 
 
-@dataclass
+@dataclass(slots=True)
 class AlphaVantageSettings:
     """Settings for the AlphaVantage client."""
 
     api_key: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AppSettings:
     """Top level application settings."""
 
@@ -1,6 +1,8 @@
 """Entry point for the daily Cloud Run job."""
 from __future__ import annotations
 
+from typing import Dict
+
 from app.config import AppSettings
 from app.market_analysis.analyzer import MarketAnalyzer
 from app.market_analysis.data_sources import (
@@ -17,14 +19,16 @@ from app.strategies.bull import BullStrategy
 from app.strategies.sideways import SidewaysStrategy
 
 
+_STRATEGIES: Dict[str, Strategy] = {
+    "bull": BullStrategy(),
+    "bear": BearStrategy(),
+    "sideways": SidewaysStrategy(),
+}
+
+
 def pick_strategy(regime: str) -> Strategy:
     """Return the strategy instance for the detected regime."""
-    registry = {
-        "bull": BullStrategy(),
-        "bear": BearStrategy(),
-        "sideways": SidewaysStrategy(),
-    }
-    return registry[regime]
+    return _STRATEGIES[regime]
 
 
 def run() -> StrategyResult:
@@ -41,50 +45,50 @@ def run() -> StrategyResult:
 
     strategy = pick_strategy(assessment.regime)
 
-    state_store = StrategyStateStore()
     position_manager = PositionManager(alpaca_trading_client)
 
-    position = position_manager.find_position(strategy.underlying_symbol)
-    stored_state = state_store.get(strategy.underlying_symbol)
+    with StrategyStateStore() as state_store:
+        position = position_manager.find_position(strategy.underlying_symbol)
+        stored_state = state_store.get(strategy.underlying_symbol)
 
-    if position and stored_state and stored_state.strategy_name == strategy.name:
-        health = position_manager.evaluate_health(
-            position=position,
-            take_profit_pct=strategy.take_profit_pct,
-            stop_loss_pct=strategy.stop_loss_pct,
-        )
-        if health.status in {"take_profit", "stop_loss"}:
+        if position and stored_state and stored_state.strategy_name == strategy.name:
+            health = position_manager.evaluate_health(
+                position=position,
+                take_profit_pct=strategy.take_profit_pct,
+                stop_loss_pct=strategy.stop_loss_pct,
+            )
+            if health.status in {"take_profit", "stop_loss"}:
+                position_manager.close_position(position)
+                state_store.remove(strategy.underlying_symbol)
+                return StrategyResult(
+                    name=strategy.name,
+                    action=health.status,
+                    detail=health.reason,
+                )
+            return StrategyResult(
+                name=strategy.name,
+                action="hold",
+                detail="position remains within risk limits",
+            )
+
+        if position and stored_state:
             position_manager.close_position(position)
             state_store.remove(strategy.underlying_symbol)
             return StrategyResult(
                 name=strategy.name,
-                action=health.status,
-                detail=health.reason,
+                action="close_mismatched",
+                detail="position existed but did not match stored strategy",
             )
-        return StrategyResult(
-            name=strategy.name,
-            action="hold",
-            detail="position remains within risk limits",
-        )
 
-    if position and stored_state:
-        position_manager.close_position(position)
-        state_store.remove(strategy.underlying_symbol)
+        legs = strategy.build_order_legs()
+        position_manager.open_order(tag=strategy.name, legs=legs)
+        state_store.set(strategy.underlying_symbol, strategy.name)
         return StrategyResult(
             name=strategy.name,
-            action="close_mismatched",
-            detail="position existed but did not match stored strategy",
+            action="open",
+            detail=f"opened new {strategy.underlying_symbol} position",
         )
 
-    legs = strategy.build_order_legs()
-    position_manager.open_order(tag=strategy.name, legs=legs)
-    state_store.set(strategy.underlying_symbol, strategy.name)
-    return StrategyResult(
-        name=strategy.name,
-        action="open",
-        detail=f"opened new {strategy.underlying_symbol} position",
-    )
-
 
 if __name__ == "__main__":  # pragma: no cover - script entry point
     result = run()
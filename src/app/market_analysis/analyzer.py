@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from app.market_analysis.data_sources import MarketSnapshot
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketAssessment:
     """Result of the market condition analysis."""
 
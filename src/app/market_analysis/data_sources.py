@@ -1,6 +1,7 @@
 """Utilities for fetching market data from third-party APIs."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict
 
@@ -10,7 +11,7 @@ from app.config import AlphaVantageSettings
 from app.config import AlpacaSettings
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketSnapshot:
     """Aggregate snapshot of metrics used for analysis."""
 
@@ -24,6 +25,7 @@ class AlphaVantageClient:
 
     def __init__(self, settings: AlphaVantageSettings) -> None:
         self._settings = settings
+        self._session = requests.Session()
 
     def fetch_vix_daily(self) -> float:
         """Return the latest VIX value using AlphaVantage."""
@@ -31,12 +33,13 @@ class AlphaVantageClient:
         params = {
             "function": "TIME_SERIES_DAILY",
             "symbol": "VIX",
+            "outputsize": "compact",
             "apikey": self._settings.api_key,
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = self._session.get(url, params=params, timeout=10)
         response.raise_for_status()
         data: Dict[str, Dict[str, str]] = response.json().get("Time Series (Daily)", {})
-        latest_day = sorted(data.keys())[-1]
+        latest_day = max(data)
         return float(data[latest_day]["4. close"])
 
     def fetch_sentiment_score(self) -> float:
@@ -47,7 +50,7 @@ class AlphaVantageClient:
             "tickers": "SPY,QQQ,DIA",
             "apikey": self._settings.api_key,
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = self._session.get(url, params=params, timeout=10)
         response.raise_for_status()
         feed = response.json().get("feed", [])
         if not feed:
@@ -75,16 +78,30 @@ class AlpacaMarketClient:
         response = self._session.get(url, timeout=10)
         response.raise_for_status()
         movers = response.json().get("movers", [])
-        advancers = sum(1 for item in movers if item.get("change", 0) > 0)
-        decliners = sum(1 for item in movers if item.get("change", 0) < 0)
+        advancers = decliners = 0
+        for item in movers:
+            change = item.get("change", 0)
+            if change > 0:
+                advancers += 1
+            elif change < 0:
+                decliners += 1
         if decliners == 0:
             return float(advancers)
         return advancers / decliners
 
 
 def build_snapshot(*, alpha_client: AlphaVantageClient, alpaca_client: AlpacaMarketClient) -> MarketSnapshot:
-    """Gather key metrics for the analysis."""
-    vix = alpha_client.fetch_vix_daily()
-    sentiment = alpha_client.fetch_sentiment_score()
-    breadth = alpaca_client.fetch_market_breadth()
-    return MarketSnapshot(vix=vix, sentiment_score=sentiment, breadth_ratio=breadth)
+    """Gather key metrics for the analysis.
+
+    The three requests are independent, so they run concurrently and the
+    snapshot takes as long as the slowest call rather than the sum of all three.
+    """
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        vix = executor.submit(alpha_client.fetch_vix_daily)
+        sentiment = executor.submit(alpha_client.fetch_sentiment_score)
+        breadth = executor.submit(alpaca_client.fetch_market_breadth)
+        return MarketSnapshot(
+            vix=vix.result(),
+            sentiment_score=sentiment.result(),
+            breadth_ratio=breadth.result(),
+        )
@@ -2,14 +2,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Mapping, Optional
 
 import requests
 
 from app.config import AlpacaSettings
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Representation of an open position."""
 
@@ -27,6 +27,17 @@ class Position:
         return (change / self.avg_entry_price) * 100
 
 
+@dataclass(slots=True, frozen=True)
+class OrderTemplate:
+    """Fixed order parameters reused across submissions."""
+
+    symbol: str
+    quantity: float
+    side: str
+    order_type: str
+    time_in_force: str
+
+
 class AlpacaClient:
     """Very small subset of the Alpaca API used by the app."""
 
@@ -61,23 +72,18 @@ class AlpacaClient:
 
     def submit_order(
         self,
-        *,
-        symbol: str,
-        quantity: float,
-        side: str,
-        order_type: str,
-        time_in_force: str,
+        template: OrderTemplate,
         tag: Optional[str] = None,
-        legs: Optional[Iterable[dict]] = None,
+        legs: Optional[Iterable[Mapping[str, object]]] = None,
     ) -> dict:
         """Submit a multi-leg order for paper trading."""
         url = f"{self._settings.base_url}/v2/orders"
         payload: dict = {
-            "symbol": symbol,
-            "qty": quantity,
-            "side": side,
-            "type": order_type,
-            "time_in_force": time_in_force,
+            "symbol": template.symbol,
+            "qty": template.quantity,
+            "side": template.side,
+            "type": template.order_type,
+            "time_in_force": template.time_in_force,
             "extended_hours": False,
         }
 
@@ -85,7 +91,7 @@ class AlpacaClient:
             payload["client_order_id"] = tag
 
         if legs:
-            payload["legs"] = list(legs)
+            payload["legs"] = [dict(leg) for leg in legs]
 
         response = self._session.post(url, json=payload, timeout=10)
         response.raise_for_status()
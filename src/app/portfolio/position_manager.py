@@ -2,12 +2,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Optional
+from typing import Dict, Iterable, List, Mapping, Optional
 
-from app.portfolio.alpaca_client import AlpacaClient, Position
+from app.portfolio.alpaca_client import AlpacaClient, OrderTemplate, Position
 
+_COMBO_ORDER = OrderTemplate(
+    symbol="combo",  # placeholder for multi-leg order
+    quantity=1,
+    side="buy",
+    order_type="limit",
+    time_in_force="day",
+)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PositionHealth:
     """Simple summary of a position's health."""
 
@@ -15,19 +23,34 @@ class PositionHealth:
     reason: str
 
 
+_TAKE_PROFIT = PositionHealth(status="take_profit", reason="target reached")
+_STOP_LOSS = PositionHealth(status="stop_loss", reason="drawdown too large")
+_HOLD = PositionHealth(status="hold", reason="within risk limits")
+
+
 class PositionManager:
     """Evaluates current positions and applies strategy rules."""
 
     def __init__(self, alpaca: AlpacaClient) -> None:
         self._alpaca = alpaca
 
-    def find_position(self, symbol: str) -> Optional[Position]:
-        """Return the matching position if it exists."""
-        positions = self._alpaca.list_positions()
-        for position in positions:
-            if position.symbol == symbol:
-                return position
-        return None
+    def snapshot(self) -> Dict[str, Position]:
+        """Return all open positions keyed by symbol."""
+        return {position.symbol: position for position in self._alpaca.list_positions()}
+
+    def find_position(
+        self,
+        symbol: str,
+        snapshot: Optional[Dict[str, Position]] = None,
+    ) -> Optional[Position]:
+        """Return the matching position if it exists.
+
+        Pass a ``snapshot`` from :meth:`snapshot` to look up several symbols
+        without refetching the position list for each one.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+        return snapshot.get(symbol)
 
     def evaluate_health(
         self,
@@ -37,25 +60,35 @@ class PositionManager:
         stop_loss_pct: float,
     ) -> PositionHealth:
         """Decide whether to hold, take profit, or stop loss."""
-        change = position.unrealized_pct()
+        return self._health_for_change(position.unrealized_pct(), take_profit_pct, -abs(stop_loss_pct))
+
+    def evaluate_health_batch(
+        self,
+        positions: Iterable[Position],
+        *,
+        take_profit_pct: float,
+        stop_loss_pct: float,
+    ) -> List[PositionHealth]:
+        """Evaluate several positions against the same risk limits."""
+        stop_loss_floor = -abs(stop_loss_pct)
+        return [
+            self._health_for_change(position.unrealized_pct(), take_profit_pct, stop_loss_floor)
+            for position in positions
+        ]
+
+    @staticmethod
+    def _health_for_change(change: float, take_profit_pct: float, stop_loss_floor: float) -> PositionHealth:
+        """Classify an unrealized percentage change against precomputed limits."""
         if change >= take_profit_pct:
-            return PositionHealth(status="take_profit", reason="target reached")
-        if change <= -abs(stop_loss_pct):
-            return PositionHealth(status="stop_loss", reason="drawdown too large")
-        return PositionHealth(status="hold", reason="within risk limits")
+            return _TAKE_PROFIT
+        if change <= stop_loss_floor:
+            return _STOP_LOSS
+        return _HOLD
 
     def close_position(self, position: Position) -> None:
         """Close a paper position."""
         self._alpaca.close_position(position.symbol)
 
-    def open_order(self, *, tag: str, legs: Iterable[dict]) -> None:
+    def open_order(self, *, tag: str, legs: Iterable[Mapping[str, object]]) -> None:
         """Submit a multi-leg options order."""
-        self._alpaca.submit_order(
-            symbol="combo",  # placeholder for multi-leg order
-            quantity=1,
-            side="buy",
-            order_type="limit",
-            time_in_force="day",
-            tag=tag,
-            legs=legs,
-        )
+        self._alpaca.submit_order(_COMBO_ORDER, tag, legs)
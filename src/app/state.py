@@ -10,7 +10,7 @@ from typing import Dict, Optional
 STATE_FILE = Path("state/positions.json")
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyState:
     """State about a strategy-applied position."""
 
@@ -19,39 +19,73 @@ class StrategyState:
 
 
 class StrategyStateStore:
-    """Very small JSON-backed store for strategy state."""
+    """Very small JSON-backed store for strategy state.
+
+    The state file is read once and kept in memory. ``set`` and ``remove`` only
+    mark the store as dirty; ``flush`` (called automatically when the store is
+    used as a context manager) writes all pending changes in a single save.
+    """
 
     def __init__(self, path: Path = STATE_FILE) -> None:
         self._path = path
+        self._entries: Optional[Dict[str, StrategyState]] = None
+        self._dirty = False
         if not self._path.parent.exists():
             self._path.parent.mkdir(parents=True, exist_ok=True)
 
+    def __enter__(self) -> "StrategyStateStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
+
+    def _ensure_loaded(self) -> Dict[str, StrategyState]:
+        """Read the state file on first use and return the cached entries."""
+        if self._entries is None:
+            if self._path.exists():
+                data = json.loads(self._path.read_text())
+                self._entries = {
+                    symbol: StrategyState(symbol=symbol, strategy_name=item["strategy_name"])
+                    for symbol, item in data.items()
+                }
+            else:
+                self._entries = {}
+        return self._entries
+
     def load(self) -> Dict[str, StrategyState]:
         """Load all state entries."""
-        if not self._path.exists():
-            return {}
-        data = json.loads(self._path.read_text())
-        return {symbol: StrategyState(symbol=symbol, strategy_name=item["strategy_name"]) for symbol, item in data.items()}
+        return dict(self._ensure_loaded())
 
     def save(self, entries: Dict[str, StrategyState]) -> None:
-        """Persist all state entries."""
+        """Persist all state entries, atomically replacing the state file."""
         serializable = {
             symbol: {"strategy_name": state.strategy_name} for symbol, state in entries.items()
         }
-        self._path.write_text(json.dumps(serializable, indent=2))
+        tmp_path = self._path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(serializable, indent=2))
+        tmp_path.replace(self._path)
+        self._entries = dict(entries)
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Write pending changes to disk, if there are any."""
+        if self._dirty and self._entries is not None:
+            self.save(self._entries)
 
     def get(self, symbol: str) -> Optional[StrategyState]:
         """Return the stored state for a symbol."""
-        return self.load().get(symbol)
+        return self._ensure_loaded().get(symbol)
 
     def set(self, symbol: str, strategy_name: str) -> None:
         """Record the strategy used for a symbol."""
-        entries = self.load()
+        entries = self._ensure_loaded()
+        current = entries.get(symbol)
+        if current is not None and current.strategy_name == strategy_name:
+            return
         entries[symbol] = StrategyState(symbol=symbol, strategy_name=strategy_name)
-        self.save(entries)
+        self._dirty = True
 
     def remove(self, symbol: str) -> None:
         """Remove state for a symbol."""
-        entries = self.load()
-        entries.pop(symbol, None)
-        self.save(entries)
+        if self._ensure_loaded().pop(symbol, None) is not None:
+            self._dirty = True
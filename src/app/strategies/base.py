@@ -2,10 +2,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Mapping
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyResult:
     """Simple description of the action taken."""
 
@@ -17,10 +17,12 @@ class StrategyResult:
 class Strategy:
     """Contract for executable strategies."""
 
+    __slots__ = ()
+
     name: str
     underlying_symbol: str
     take_profit_pct: float
     stop_loss_pct: float
 
-    def build_order_legs(self) -> Iterable[dict]:  # pragma: no cover - simple contract
+    def build_order_legs(self) -> Iterable[Mapping[str, object]]:  # pragma: no cover - simple contract
         raise NotImplementedError
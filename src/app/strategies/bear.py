@@ -1,12 +1,21 @@
 """Bear market strategy: bearish put spread."""
 from __future__ import annotations
 
+from types import MappingProxyType
+
 from app.strategies.base import Strategy
 
+_LEGS = (
+    MappingProxyType({"symbol": "DIA230915P00340000", "ratio": 1, "side": "buy"}),
+    MappingProxyType({"symbol": "DIA230915P00330000", "ratio": 1, "side": "sell"}),
+)
+
 
 class BearStrategy(Strategy):
     """Constructs a bearish put spread on DIA."""
 
+    __slots__ = ()
+
     name = "bear_put_spread"
     underlying_symbol = "DIA"
     take_profit_pct = 30.0
@@ -14,7 +23,4 @@ class BearStrategy(Strategy):
 
     def build_order_legs(self):
         """Return legs for a bearish put spread on DIA."""
-        return [
-            {"symbol": "DIA230915P00340000", "ratio": 1, "side": "buy"},
-            {"symbol": "DIA230915P00330000", "ratio": 1, "side": "sell"},
-        ]
+        return _LEGS
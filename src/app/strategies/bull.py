@@ -1,12 +1,23 @@
 """Bull market strategy: bullish iron condor variation."""
 from __future__ import annotations
 
+from types import MappingProxyType
+
 from app.strategies.base import Strategy
 
+_LEGS = (
+    MappingProxyType({"symbol": "QQQ230915C00370000", "ratio": 1, "side": "sell"}),
+    MappingProxyType({"symbol": "QQQ230915C00375000", "ratio": 1, "side": "buy"}),
+    MappingProxyType({"symbol": "QQQ230915P00340000", "ratio": 1, "side": "buy"}),
+    MappingProxyType({"symbol": "QQQ230915P00345000", "ratio": 1, "side": "sell"}),
+)
+
 
 class BullStrategy(Strategy):
     """Constructs a bullish options spread."""
 
+    __slots__ = ()
+
     name = "bull_iron_condor"
     underlying_symbol = "QQQ"
     take_profit_pct = 25.0
@@ -14,9 +25,4 @@ class BullStrategy(Strategy):
 
     def build_order_legs(self):
         """Return legs for a bullish iron condor on QQQ."""
-        return [
-            {"symbol": "QQQ230915C00370000", "ratio": 1, "side": "sell"},
-            {"symbol": "QQQ230915C00375000", "ratio": 1, "side": "buy"},
-            {"symbol": "QQQ230915P00340000", "ratio": 1, "side": "buy"},
-            {"symbol": "QQQ230915P00345000", "ratio": 1, "side": "sell"},
-        ]
+        return _LEGS
@@ -1,12 +1,23 @@
 """Sideways market strategy: delta-neutral iron condor."""
 from __future__ import annotations
 
+from types import MappingProxyType
+
 from app.strategies.base import Strategy
 
+_LEGS = (
+    MappingProxyType({"symbol": "SPY230915C00450000", "ratio": 1, "side": "sell"}),
+    MappingProxyType({"symbol": "SPY230915C00455000", "ratio": 1, "side": "buy"}),
+    MappingProxyType({"symbol": "SPY230915P00410000", "ratio": 1, "side": "buy"}),
+    MappingProxyType({"symbol": "SPY230915P00405000", "ratio": 1, "side": "sell"}),
+)
+
 
 class SidewaysStrategy(Strategy):
     """Constructs a market neutral iron condor on SPY."""
 
+    __slots__ = ()
+
     name = "sideways_iron_condor"
     underlying_symbol = "SPY"
     take_profit_pct = 20.0
@@ -14,9 +25,4 @@ class SidewaysStrategy(Strategy):
 
     def build_order_legs(self):
         """Return legs for a neutral iron condor on SPY."""
-        return [
-            {"symbol": "SPY230915C00450000", "ratio": 1, "side": "sell"},
-            {"symbol": "SPY230915C00455000", "ratio": 1, "side": "buy"},
-            {"symbol": "SPY230915P00410000", "ratio": 1, "side": "buy"},
-            {"symbol": "SPY230915P00405000", "ratio": 1, "side": "sell"},
-        ]
+        return _LEGS